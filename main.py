@@ -8,15 +8,41 @@ using the Cacao framework, with a file explorer sidebar and code editor.
 import os
 import sys
 import json
-from typing import Dict, List, Any, Optional
+import atexit
+import hashlib
+import threading
+import concurrent.futures
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+# Optional fast JSON serializer for debug dumps
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional filesystem watcher for cache invalidation
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
 
 import cacao
 from cacao import State, Component
 from cacao.extensions.react_extension import ReactExtension
 
-# Debug toggle
+# Debug toggle. Debug prints stay behind `if DEBUG:` guards so their
+# f-strings are never formatted when debugging is off.
 DEBUG = False
 
+def dump_debug_json(obj: Any) -> str:
+    """Serialize an object for debug output, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 # Create the app with React extension for CodeMirror
 app = cacao.App(extensions=[ReactExtension()])
 
@@ -37,30 +63,44 @@ FILE_ICONS = {
     "unknown": "📎"
 }
 
-# Get file type based on extension
+# Intern the icon glyphs so every tree node shares one object per icon
+# instead of accumulating duplicates when trees are loaded from cache.
+FILE_ICONS = {key: sys.intern(value) for key, value in FILE_ICONS.items()}
+
+# Per-extension (file type, editor mode) pairs, built once at module load;
+# a single probe answers both questions.
+_EXT_INFO = {
+    ".py": ("python", "python"),
+    ".js": ("javascript", "javascript"),
+    ".html": ("html", "htmlmixed"),
+    ".css": ("css", "css"),
+    ".json": ("json", "javascript"),
+    ".md": ("markdown", "markdown"),
+    ".txt": ("text", "text"),
+    ".jpg": ("image", "text"),
+    ".jpeg": ("image", "text"),
+    ".png": ("image", "text"),
+    ".gif": ("image", "text"),
+    ".svg": ("image", "text")
+}
+_UNKNOWN_INFO = ("unknown", "text")
+
+# Get file type based on extension only (no syscalls)
+def get_file_type_by_name(name: str) -> str:
+    """Determine file type from the name alone; never touches the filesystem."""
+    return _EXT_INFO.get(os.path.splitext(name)[1].lower(), _UNKNOWN_INFO)[0]
+
+# Get editor syntax mode based on extension only
+def get_editor_mode(name: str) -> str:
+    """Determine the editor syntax-highlighting mode from the file name."""
+    return _EXT_INFO.get(os.path.splitext(name)[1].lower(), _UNKNOWN_INFO)[1]
+
+# Get file type, checking the filesystem for directories
 def get_file_type(file_path: str) -> str:
-    """Determine file type based on extension."""
+    """Determine file type, stat-ing the path to detect directories."""
     if os.path.isdir(file_path):
         return "directory"
-        
-    extension = os.path.splitext(file_path)[1].lower()
-    
-    type_map = {
-        ".py": "python",
-        ".js": "javascript",
-        ".html": "html",
-        ".css": "css",
-        ".json": "json",
-        ".md": "markdown",
-        ".txt": "text",
-        ".jpg": "image",
-        ".jpeg": "image",
-        ".png": "image",
-        ".gif": "image",
-        ".svg": "image"
-    }
-    
-    return type_map.get(extension, "unknown")
+    return get_file_type_by_name(file_path)
 
 # Get icon for file type
 def get_file_icon(file_path: str) -> str:
@@ -68,59 +108,487 @@ def get_file_icon(file_path: str) -> str:
     file_type = get_file_type(file_path)
     return FILE_ICONS.get(file_type, FILE_ICONS["unknown"])
 
+# How many bytes of a file to load into the editor initially
+MAX_INITIAL_READ = 256 * 1024
+
 # Read file content
-def read_file_content(file_path: str) -> str:
-    """Read file content."""
+def read_file_content(file_path: str, max_bytes: Optional[int] = MAX_INITIAL_READ) -> Dict[str, Any]:
+    """Read up to max_bytes of a file (None for all of it).
+
+    Returns the decoded content plus whether it was truncated and the full
+    file size, taken from fstat on the already-open descriptor.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        with open(file_path, 'rb') as f:
+            data = f.read(max_bytes) if max_bytes is not None else f.read()
+            truncated = max_bytes is not None and f.read(1) != b""
+            size = os.fstat(f.fileno()).st_size
+        return {
+            "content": data.decode('utf-8', errors='replace'),
+            "truncated": truncated,
+            "size": size
+        }
     except Exception as e:
-        return f"Error reading file: {str(e)}"
+        return {"content": f"Error reading file: {str(e)}", "truncated": False, "size": 0}
 
-# Scan workspace directory and build file tree
-def scan_workspace(workspace_dir: str) -> Dict[str, Any]:
-    """Scan workspace directory and build file tree."""
-    workspace = {"name": os.path.basename(workspace_dir), "path": workspace_dir, "type": "directory", "children": []}
-    
+# LRU cache of read results keyed by (path, mtime_ns, size); the mtime key
+# means external edits invalidate entries automatically.
+_content_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+CONTENT_CACHE_MAX_ENTRIES = 64
+CONTENT_CACHE_MAX_BYTES = 1024 * 1024
+
+def cache_file_content(key: tuple, result: Dict[str, Any]) -> None:
+    """Insert a read result into the content cache, evicting the oldest entry."""
+    if len(result["content"]) > CONTENT_CACHE_MAX_BYTES:
+        return
+    _content_cache[key] = result
+    _content_cache.move_to_end(key)
+    while len(_content_cache) > CONTENT_CACHE_MAX_ENTRIES:
+        _content_cache.popitem(last=False)
+
+def read_file_content_cached(file_path: str) -> Dict[str, Any]:
+    """Read a file through the content cache; repeat selections are dict hits."""
     try:
-        items = os.listdir(workspace_dir)
-        
+        st = os.stat(file_path)
+        key = (file_path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return read_file_content(file_path)
+
+    cached = _content_cache.get(key)
+    if cached is not None:
+        _content_cache.move_to_end(key)
+        return cached
+
+    result = read_file_content(file_path)
+    cache_file_content(key, result)
+    return result
+
+def peek_file_content(file_path: str) -> Optional[Dict[str, Any]]:
+    """Return the cached read result for a path, or None without touching disk."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    cached = _content_cache.get((file_path, st.st_mtime_ns, st.st_size))
+    if cached is not None:
+        _content_cache.move_to_end((file_path, st.st_mtime_ns, st.st_size))
+    return cached
+
+# Debounced atomic writes: keystroke-driven saves are coalesced so a burst
+# of updates costs one filesystem write, and the write itself goes through
+# a temp file + os.replace so the file on disk is never half-written.
+WRITE_DEBOUNCE_SECONDS = 0.25
+
+_pending_writes: Dict[str, Tuple[threading.Timer, str]] = {}
+_pending_writes_lock = threading.Lock()
+
+# Suffix of the temp files used for atomic writes; the workspace watcher
+# uses it to tell the app's own write traffic from real changes
+_ATOMIC_TMP_SUFFIX = f".tmp.{os.getpid()}"
+
+def write_file_atomic(file_path: str, content: str) -> None:
+    """Write content to a temp file, fsync it and atomically replace the target."""
+    tmp_path = file_path + _ATOMIC_TMP_SUFFIX
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
+
+def flush_pending_write(file_path: str, content: str) -> None:
+    """Perform the debounced write and prime the content cache."""
+    with _pending_writes_lock:
+        _pending_writes.pop(file_path, None)
+    try:
+        write_file_atomic(file_path, content)
+        # Prime the cache with the fresh mtime so the next selection is a hit
+        st = os.stat(file_path)
+        cache_file_content(
+            (file_path, st.st_mtime_ns, st.st_size),
+            {"content": content, "truncated": False, "size": st.st_size}
+        )
+        if save_error_state.value is not None:
+            save_error_state.set(None)
+    except Exception as e:
+        print(f"Error writing file {file_path}: {str(e)}")
+        # The update event already returned by the time a debounced write
+        # fails, so surface it through state for the status bar to render
+        save_error_state.set(f"Failed to save {os.path.basename(file_path)}: {str(e)}")
+
+def schedule_file_write(file_path: str, content: str) -> None:
+    """Schedule a debounced write, replacing any still-pending one for the path."""
+    with _pending_writes_lock:
+        pending = _pending_writes.pop(file_path, None)
+        if pending is not None:
+            pending[0].cancel()
+        timer = threading.Timer(WRITE_DEBOUNCE_SECONDS, flush_pending_write, args=(file_path, content))
+        timer.daemon = True
+        _pending_writes[file_path] = (timer, content)
+        timer.start()
+
+def _flush_pending_writes_at_exit() -> None:
+    """Flush every write still inside its debounce window at shutdown.
+
+    The timers are daemon threads, so without this a save made in the last
+    quarter second before exit would never reach disk.
+    """
+    with _pending_writes_lock:
+        pending = list(_pending_writes.items())
+    for file_path, (timer, content) in pending:
+        timer.cancel()
+        flush_pending_write(file_path, content)
+
+atexit.register(_flush_pending_writes_at_exit)
+
+# Directories skipped while scanning; typically vendored or generated trees
+# that dominate metadata traffic without ever being opened in the editor.
+IGNORE_DIRS = {
+    ".git",
+    "node_modules",
+    "__pycache__",
+    ".venv",
+    "dist",
+    "build",
+    ".mypy_cache",
+    ".pytest_cache"
+}
+
+# Flat index over the workspace tree: every node is registered here by path,
+# so lookups are single dict probes instead of a per-level tree walk.
+nodes_by_path: Dict[str, Dict[str, Any]] = {}
+
+def index_tree(tree: Dict[str, Any]) -> None:
+    """Rebuild the flat path index from a (possibly cache-loaded) tree."""
+    nodes_by_path.clear()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        # Cache-loaded trees carry fresh string objects; re-intern the
+        # repeated ones (names recur across directories, types and icons
+        # recur across the whole tree).
+        for key in ("name", "type", "icon"):
+            if key in node:
+                node[key] = sys.intern(node[key])
+        if "component_id" not in node:
+            prefix = "dir-item" if node.get("type") == "directory" else "file-item"
+            node["component_id"] = f"{prefix}-{node.get('path', '').replace(os.sep, '_')}"
+        nodes_by_path[node.get("path", "")] = node
+        for child in node.get("children") or []:
+            stack.append(child)
+
+# Shallow-scan a single directory level
+def scan_directory(dir_path: str) -> List[Dict[str, Any]]:
+    """Scan one directory level; subdirectories get children=None (unscanned)."""
+    children = []
+
+    try:
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+
         # Sort items: directories first, then files alphabetically
-        dirs = sorted([item for item in items if os.path.isdir(os.path.join(workspace_dir, item))])
-        files = sorted([item for item in items if not os.path.isdir(os.path.join(workspace_dir, item))])
-        sorted_items = dirs + files
-        
-        for item in sorted_items:
-            item_path = os.path.join(workspace_dir, item)
-            item_type = "directory" if os.path.isdir(item_path) else get_file_type(item_path)
-            
-            if os.path.isdir(item_path):
-                # Recursively scan subdirectories
-                workspace["children"].append(scan_workspace(item_path))
-            else:
-                workspace["children"].append({
-                    "name": item,
-                    "path": item_path,
-                    "type": item_type
-                })
+        dirs = sorted([entry for entry in entries
+                       if entry.is_dir(follow_symlinks=False) and entry.name not in IGNORE_DIRS],
+                      key=lambda e: e.name)
+        files = sorted([entry for entry in entries if not entry.is_dir(follow_symlinks=False)], key=lambda e: e.name)
+
+        for entry in dirs:
+            # children=None marks the directory as not yet scanned; it is
+            # filled in on first expansion instead of eagerly at startup.
+            children.append({
+                "name": sys.intern(entry.name),
+                "path": entry.path,
+                "type": "directory",
+                "icon": FILE_ICONS["directory"],
+                "component_id": f"dir-item-{entry.path.replace(os.sep, '_')}",
+                "children": None
+            })
+
+        for entry in files:
+            file_type = get_file_type_by_name(entry.name)
+            children.append({
+                "name": sys.intern(entry.name),
+                "path": entry.path,
+                "type": file_type,
+                "icon": FILE_ICONS.get(file_type, FILE_ICONS["unknown"]),
+                "component_id": f"file-item-{entry.path.replace(os.sep, '_')}"
+            })
     except Exception as e:
-        print(f"Error scanning workspace: {str(e)}")
-    
+        print(f"Error scanning directory: {str(e)}")
+
+    # Register the nodes in the flat path index
+    for child in children:
+        nodes_by_path[child["path"]] = child
+
+    return children
+
+# Scan workspace directory and build file tree
+def scan_workspace(workspace_dir: str) -> Dict[str, Any]:
+    """Scan the workspace root; deeper levels are scanned lazily on expansion."""
+    nodes_by_path.clear()
+    workspace = {
+        "name": os.path.basename(workspace_dir),
+        "path": workspace_dir,
+        "type": "directory",
+        "icon": FILE_ICONS["directory"],
+        "component_id": f"dir-item-{workspace_dir.replace(os.sep, '_')}",
+        "children": scan_directory(workspace_dir)
+    }
+    nodes_by_path[workspace_dir] = workspace
     return workspace
 
+# In-memory cache of expanded directory listings, keyed by path
+expanded_dirs: Dict[str, List[Dict[str, Any]]] = {}
+
+# Bumped whenever the tree's structure changes in place (expansion, rescan)
+# so renders can tell a mutated tree from an untouched one.
+tree_generation = 0
+
+def bump_tree_generation() -> None:
+    """Mark the workspace tree as structurally changed."""
+    global tree_generation
+    tree_generation += 1
+
+# Shared executor for concurrent directory scans. Filesystem syscalls release
+# the GIL, so issuing stat/getdents from several threads hides per-call
+# latency on a cold page cache instead of serializing behind the disk.
+scan_executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+# Below this many directories a parallel dispatch costs more than it saves
+PARALLEL_SCAN_THRESHOLD = 4
+
+def scan_directories(dir_paths: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Scan several directories concurrently, returning listings keyed by path."""
+    if len(dir_paths) < PARALLEL_SCAN_THRESHOLD:
+        return {dir_path: scan_directory(dir_path) for dir_path in dir_paths}
+
+    futures = {dir_path: scan_executor.submit(scan_directory, dir_path) for dir_path in dir_paths}
+    return {dir_path: future.result() for dir_path, future in futures.items()}
+
+# Find a node in the workspace tree by path
+def find_node(tree: Dict[str, Any], path: str) -> Optional[Dict[str, Any]]:
+    """Find the tree node for a path: one index probe, tree walk as fallback."""
+    node = nodes_by_path.get(path)
+    if node is not None:
+        return node
+    if tree.get("path") == path:
+        return tree
+    node = tree
+    while node is not None:
+        parent = node
+        node = None
+        for child in parent.get("children") or []:
+            child_path = child.get("path", "")
+            if child_path == path:
+                return child
+            if child.get("type") == "directory" and path.startswith(child_path + os.sep):
+                node = child
+                break
+    return None
+
+# Workspace tree cache: persists the scan result so unchanged trees load
+# without re-walking the filesystem on every startup.
+CACHE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "vscode-cacao-replica")
+
+def get_cache_path(workspace_dir: str) -> str:
+    """Get the tree cache file path for a workspace directory."""
+    digest = hashlib.md5(workspace_dir.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_ROOT, digest, "tree.json")
+
+def get_workspace_mtimes(workspace_dir: str) -> Dict[str, float]:
+    """Collect mtimes for the workspace root and its top-level entries."""
+    mtimes = {workspace_dir: os.stat(workspace_dir).st_mtime}
+    try:
+        with os.scandir(workspace_dir) as it:
+            for entry in it:
+                mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime
+    except Exception as e:
+        print(f"Error collecting workspace mtimes: {str(e)}")
+    return mtimes
+
+def save_workspace_cache(workspace_dir: str, tree: Dict[str, Any]) -> None:
+    """Save the scanned tree and current mtimes to the cache file."""
+    cache_path = get_cache_path(workspace_dir)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            # The ignore set is part of what the tree reflects: a cache
+            # written with --no-ignore must not satisfy a default run
+            json.dump({
+                "mtimes": get_workspace_mtimes(workspace_dir),
+                "ignore_dirs": sorted(IGNORE_DIRS),
+                "tree": tree
+            }, f)
+    except Exception as e:
+        print(f"Error saving workspace cache: {str(e)}")
+
+def load_workspace(workspace_dir: str) -> Dict[str, Any]:
+    """Load the workspace tree from cache if unchanged, otherwise rescan."""
+    cache_path = get_cache_path(workspace_dir)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if (cached.get("mtimes") == get_workspace_mtimes(workspace_dir)
+                and cached.get("ignore_dirs") == sorted(IGNORE_DIRS)):
+            index_tree(cached["tree"])
+            return cached["tree"]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Error loading workspace cache: {str(e)}")
+
+    tree = scan_workspace(workspace_dir)
+    save_workspace_cache(workspace_dir, tree)
+    return tree
+
 # Initialize workspace
 workspace_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "workspace")
-workspace_state.set(scan_workspace(workspace_dir))
+workspace_state.set(load_workspace(workspace_dir))
+
+# Rescan the workspace and refresh state + cache
+def invalidate_and_rescan() -> None:
+    """Rescan the workspace, refresh the cache and update workspace state."""
+    tree = scan_workspace(workspace_dir)
+
+    # Re-scan previously expanded directories so open folders stay populated;
+    # the scans are dispatched concurrently since each is an independent
+    # syscall-bound listing.
+    for dir_path in list(expanded_dirs):
+        if not os.path.isdir(dir_path):
+            del expanded_dirs[dir_path]
+
+    listings = scan_directories(list(expanded_dirs))
+    for dir_path, children in listings.items():
+        expanded_dirs[dir_path] = children
+        node = find_node(tree, dir_path)
+        if node is not None:
+            node["children"] = children
+
+    save_workspace_cache(workspace_dir, tree)
+    bump_tree_generation()
+    workspace_state.set(tree)
+
+# Watch the workspace for changes so the cache never goes stale
+WATCH_DEBOUNCE_SECONDS = 0.5
+
+if Observer is not None:
+    class WorkspaceChangeHandler(FileSystemEventHandler):
+        """Invalidate the workspace cache when files are created, deleted or moved.
+
+        Events from the app's own atomic writes (the temp file appearing and
+        the os.replace onto the target) are ignored — rescanning after every
+        save would undo the point of caching, and a scan racing the write
+        window could surface the temp file in the explorer. Real events are
+        debounced so a burst of changes costs one rescan.
+        """
+
+        def __init__(self):
+            self._timer: Optional[threading.Timer] = None
+            self._lock = threading.Lock()
+
+        def _schedule_rescan(self, event) -> None:
+            if event.src_path.endswith(_ATOMIC_TMP_SUFFIX):
+                return
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(WATCH_DEBOUNCE_SECONDS, invalidate_and_rescan)
+                self._timer.daemon = True
+                self._timer.start()
+
+        def on_created(self, event):
+            self._schedule_rescan(event)
+
+        def on_deleted(self, event):
+            self._schedule_rescan(event)
+
+        def on_moved(self, event):
+            self._schedule_rescan(event)
+
+    workspace_observer = Observer()
+    workspace_observer.schedule(WorkspaceChangeHandler(), workspace_dir, recursive=True)
+    workspace_observer.daemon = True
+    workspace_observer.start()
 
 # Set default file (README.md)
 default_file_path = os.path.join(workspace_dir, "README.md")
 current_file_state = State(default_file_path)  # Currently selected file
 
-# Load default file content
-default_content = read_file_content(default_file_path)
-file_content_state = State(default_content)    # Content of the selected file
+# Content is loaded lazily on first render (after the event loop is up)
+# rather than blocking module import with a synchronous read.
+file_content_state = State(None)       # Content of the selected file
+file_truncated_state = State(False)    # Whether only a prefix is loaded
+file_loading_state = State(False)      # Whether a background read is in flight
+save_error_state = State(None)         # Message from the last failed flush, if any
+
+def ensure_content_loaded() -> str:
+    """Load the current file's content on first use, via the content cache."""
+    content = file_content_state.value
+    if content is None:
+        current_file = current_file_state.value
+        if not current_file:
+            return ""
+        result = read_file_content_cached(current_file)
+        content = result["content"]
+        file_content_state.set(content)
+        file_truncated_state.set(result["truncated"])
+    return content
+
 
 
+# Static style fragments shared by every file-tree row. Reusing these
+# constants means a render allocates only the small per-row dicts holding
+# the dynamic bits (indentation, selection colors) instead of rebuilding
+# a dozen identical key/value pairs per node.
+_ROW_BASE_STYLE = {
+    "display": "flex",
+    "alignItems": "center",
+    "padding": "4px 8px",
+    "borderRadius": "4px",
+    "margin": "2px 0",
+}
+
+_CHEVRON_STYLE = {
+    "marginRight": "4px",
+    "fontSize": "12px",
+    "color": "#cccccc"
+}
+
+_ICON_STYLE = {
+    "marginRight": "8px",
+    "fontSize": "16px"
+}
+
+_FILE_ICON_STYLE = {**_ICON_STYLE, "color": "#cccccc"}
+_FILE_ICON_STYLE_CURRENT = {**_ICON_STYLE, "color": "#75beff"}  # Blue icon for current file
+
+_DIR_NAME_STYLE = {
+    "fontSize": "14px",
+    "color": "#cccccc",
+    "background": "none",
+    "border": "none",
+    "padding": "0",
+    "cursor": "pointer",
+    "textAlign": "left"
+}
+
+_FILE_NAME_BASE_STYLE = {
+    "fontSize": "14px",
+    "background": "none",
+    "border": "none",
+    "padding": "4px 8px",  # Larger clickable area
+    "margin": "-4px -8px",  # Offset the padding to maintain layout
+    "width": "calc(100% + 16px)",  # Ensure button covers the full width
+    "cursor": "pointer",
+    "textAlign": "left",
+    "transition": "color 0.2s ease, text-decoration 0.2s ease",  # Smooth transitions
+    ":hover": {
+        "color": "#ffffff",  # Brighter text on hover
+        "textDecoration": "underline"
+    }
+}
+
+_FILE_NAME_STYLE = {**_FILE_NAME_BASE_STYLE, "color": "#cccccc", "fontWeight": "normal"}
+_FILE_NAME_STYLE_CURRENT = {**_FILE_NAME_BASE_STYLE, "color": "#ffffff", "fontWeight": "bold"}
 
 # File Explorer Component
 class FileExplorer(Component):
@@ -128,48 +596,94 @@ class FileExplorer(Component):
         super().__init__()
         self.id = "file-explorer"
         self.component_type = "file-explorer"
-    
-    def render_file_tree(self, node: Dict[str, Any], level: int = 0) -> Dict[str, Any]:
-        """Render a file tree node."""
+        # Rendered items memoized by (path, level, is-directory, state bit);
+        # persists across renders so unchanged nodes are never rebuilt.
+        self._render_cache: Dict[Any, Dict[str, Any]] = {}
+        # Generation the cache was last pruned against; stale and
+        # type-flipped paths are dropped when the tree moves past it
+        self._last_pruned_generation = -1
+        # Whole-render memo: when neither the tree nor the selection changed,
+        # render() returns the pointer-identical dict from last time so the
+        # framework diff can short-circuit on object identity.
+        self._last_render: Optional[Dict[str, Any]] = None
+        self._last_render_key: Optional[tuple] = None
+
+    def invalidate_render_cache(self, *paths: Optional[str]) -> None:
+        """Evict cached items for the given paths (e.g. old/new current file)."""
+        evict = {path for path in paths if path}
+        for key in [key for key in self._render_cache if key[0] in evict]:
+            del self._render_cache[key]
+        self._last_render_key = None
+
+    def prune_render_cache(self) -> None:
+        """Drop cached rows for paths that vanished or changed type.
+
+        After a rescan, a path can disappear or flip between file and
+        directory (build tooling does this routinely); serving the old row
+        would leave a dead item in the explorer. Pruning against the fresh
+        path index also keeps the cache from growing without bound as paths
+        come and go.
+        """
+        stale = []
+        for key in self._render_cache:
+            node = nodes_by_path.get(key[0])
+            if node is None or (node.get("type") == "directory") != key[2]:
+                stale.append(key)
+        for key in stale:
+            del self._render_cache[key]
+
+    def render_node(self, node: Dict[str, Any], level: int = 0) -> Dict[str, Any]:
+        """Render a single file tree item at the given indent level."""
         is_directory = node.get("type") == "directory"
         node_path = node.get("path", "") # Get path early
-        
+
+        # Cache key captures everything the item's output depends on besides
+        # the node itself: the file/directory shape of the row, expansion
+        # state for directories, selection for files.
+        if is_directory:
+            cache_key = (node_path, level, True, node.get("children") is not None)
+        else:
+            cache_key = (node_path, level, False, node_path == current_file_state.value)
+        cached = self._render_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Create the file/directory item
         if is_directory:
-            # Directory item
+            is_expanded = node.get("children") is not None
+
+            # Directory item - chevron + name as a button that expands on click
             item = {
                 "type": "div",
-                "component_id": f"dir-item-{node_path.replace(os.sep, '_')}",
+                "component_id": node.get("component_id", f"dir-item-{node_path.replace(os.sep, '_')}"),
                 "props": {
-                    "style": {
-                        "paddingLeft": f"{level * 16}px",
-                        "display": "flex",
-                        "alignItems": "center",
-                        "padding": "4px 8px",
-                        "borderRadius": "4px",
-                        "margin": "2px 0",
-                    },
+                    "style": {**_ROW_BASE_STYLE, "paddingLeft": f"{level * 16}px"},
                     "children": [
-                        # Directory icon
+                        # Expansion chevron
                         {
                             "type": "span",
                             "props": {
-                                "content": get_file_icon(node_path),
-                                "style": {
-                                    "marginRight": "8px",
-                                    "fontSize": "16px"
-                                }
+                                "content": "▾" if is_expanded else "▸",
+                                "style": _CHEVRON_STYLE
                             }
                         },
-                        # Directory name
+                        # Directory icon
                         {
                             "type": "span",
                             "props": {
-                                "content": node.get("name", ""),
-                                "style": {
-                                    "fontSize": "14px",
-                                    "color": "#cccccc"
-                                }
+                                "content": node.get("icon", FILE_ICONS["unknown"]),
+                                "style": _ICON_STYLE
+                            }
+                        },
+                        # Directory name as a button that triggers lazy expansion
+                        {
+                            "type": "button",
+                            "component_type": "dir-button",
+                            "props": {
+                                "label": node.get("name", ""),
+                                "action": "expand_dir",
+                                "data": {"path": node_path},
+                                "style": _DIR_NAME_STYLE
                             }
                         }
                     ]
@@ -182,16 +696,12 @@ class FileExplorer(Component):
             # File item - Using a div with a button that has the path in its data property
             item = {
                 "type": "div",
-                "component_id": f"file-item-{node_path.replace(os.sep, '_')}",
+                "component_id": node.get("component_id", f"file-item-{node_path.replace(os.sep, '_')}"),
                 "component_type": "file-item",
                 "props": {
                     "style": {
+                        **_ROW_BASE_STYLE,
                         "paddingLeft": f"{level * 16}px",
-                        "display": "flex",
-                        "alignItems": "center",
-                        "padding": "4px 8px",
-                        "borderRadius": "4px",
-                        "margin": "2px 0",
                         "cursor": "pointer",
                         "backgroundColor": "#37373d" if is_current_file else "transparent",  # Highlight current file
                         "transition": "background-color 0.2s ease",  # Smooth transition for hover
@@ -204,12 +714,8 @@ class FileExplorer(Component):
                         {
                             "type": "span",
                             "props": {
-                                "content": get_file_icon(node_path),
-                                "style": {
-                                    "marginRight": "8px",
-                                    "fontSize": "16px",
-                                    "color": "#75beff" if is_current_file else "#cccccc"  # Blue icon for current file
-                                }
+                                "content": node.get("icon", FILE_ICONS["unknown"]),
+                                "style": _FILE_ICON_STYLE_CURRENT if is_current_file else _FILE_ICON_STYLE
                             }
                         },
                         # File name as a button with explicit path in data
@@ -220,60 +726,52 @@ class FileExplorer(Component):
                                 "label": node.get("name", ""),
                                 "action": "select_file",
                                 "data": {"path": node_path},  # This will now be passed to the event handler
-                                "style": {
-                                    "fontSize": "14px",
-                                    "color": "#ffffff" if is_current_file else "#cccccc",  # Brighter text for current file
-                                    "fontWeight": "bold" if is_current_file else "normal",  # Bold text for current file
-                                    "background": "none",
-                                    "border": "none",
-                                    "padding": "4px 8px",  # Larger clickable area
-                                    "margin": "-4px -8px",  # Offset the padding to maintain layout
-                                    "width": "calc(100% + 16px)",  # Ensure button covers the full width
-                                    "cursor": "pointer",
-                                    "textAlign": "left",
-                                    "transition": "color 0.2s ease, text-decoration 0.2s ease",  # Smooth transitions
-                                    ":hover": {
-                                        "color": "#ffffff",  # Brighter text on hover
-                                        "textDecoration": "underline"
-                                    }
-                                }
+                                "style": _FILE_NAME_STYLE_CURRENT if is_current_file else _FILE_NAME_STYLE
                             }
                         }
                     ]
                 }
             }
         
-        # If it's a directory, add its children
-        if is_directory and "children" in node:
-            children_container = {
-                "type": "div",
-                "props": {
-                    "children": []
-                }
-            }
-            
-            for child in node.get("children", []):
-                rendered_child = self.render_file_tree(child, level + 1)
-                if rendered_child: # Only append if not None
-                    children_container["props"]["children"].append(rendered_child)
-            
-            return {
-                "type": "div",
-                "props": {
-                    "children": [item, children_container]
-                }
-            }
-        
-        # Return the item (file or directory without children)
+        self._render_cache[cache_key] = item
         return item
-    
+
+    def iter_tree(self, root: Dict[str, Any]):
+        """Iteratively walk the tree, yielding one rendered item per node.
+
+        Uses an explicit stack instead of recursion and yields a flat item
+        sequence (indentation is carried by each item's paddingLeft), so a
+        render allocates no nested wrapper divs and no per-level call frames.
+        """
+        stack = [(root, 0)]
+        while stack:
+            node, level = stack.pop()
+            yield self.render_node(node, level)
+
+            children = node.get("children")
+            if node.get("type") == "directory" and children:
+                # Push in reverse so popping preserves display order
+                for child in reversed(children):
+                    stack.append((child, level + 1))
+
+
     def render(self, ui_state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Render the file explorer component."""
         workspace = workspace_state.value
         if DEBUG:
-            print(f"DEBUG: FileExplorer.render - workspace data: {json.dumps(workspace, indent=2)}")
-        
-        return {
+            print(f"DEBUG: FileExplorer.render - workspace data: {dump_debug_json(workspace)}")
+
+        render_key = (tree_generation, id(workspace), current_file_state.value)
+        if render_key == self._last_render_key and self._last_render is not None:
+            return self._last_render
+
+        # First render after a rescan: evict rows whose path no longer
+        # exists or no longer has the shape the cached item was built for
+        if tree_generation != self._last_pruned_generation:
+            self.prune_render_cache()
+            self._last_pruned_generation = tree_generation
+
+        rendered = {
             "type": "div",
             "props": {
                 "style": {
@@ -298,11 +796,15 @@ class FileExplorer(Component):
                             }
                         }
                     },
-                    self.render_file_tree(workspace)
+                    *self.iter_tree(workspace)
                 ]
             }
         }
 
+        self._last_render = rendered
+        self._last_render_key = render_key
+        return rendered
+
 # Editor Component
 class Editor(Component):
     def __init__(self):
@@ -315,7 +817,7 @@ class Editor(Component):
         if DEBUG:
             print(f"DEBUG: Editor.render called.")
         current_file = current_file_state.value
-        file_content = file_content_state.value
+        file_content = ensure_content_loaded()
         if DEBUG:
             print(f"DEBUG: Editor.render - current_file: {current_file}")
             print(f"DEBUG: Editor.render - file_content (length): {len(file_content)}")
@@ -362,22 +864,8 @@ class Editor(Component):
                 }
             }
         
-        # Get file extension for syntax highlighting
-        file_ext = os.path.splitext(current_file)[1].lower().replace(".", "")
-        if file_ext == "py":
-            mode = "python"
-        elif file_ext == "js":
-            mode = "javascript"
-        elif file_ext == "html":
-            mode = "htmlmixed"
-        elif file_ext == "css":
-            mode = "css"
-        elif file_ext == "json":
-            mode = "javascript"
-        elif file_ext == "md":
-            mode = "markdown"
-        else:
-            mode = "text"
+        # Get syntax highlighting mode from the extension table
+        mode = get_editor_mode(current_file)
         
         # Editor header with filename
         header = {
@@ -460,7 +948,28 @@ class Editor(Component):
                 ]
             }
         }
-        
+
+        # Offer to load the rest of the file when only a prefix is shown
+        if file_truncated_state.value:
+            editor["props"]["children"].append({
+                "type": "button",
+                "component_id": "load-more-button",
+                "props": {
+                    "label": "Load more",
+                    "action": "load_more_content",
+                    "data": {"path": current_file},
+                    "style": {
+                        "margin": "8px",
+                        "padding": "6px 12px",
+                        "backgroundColor": "#0e639c",
+                        "color": "white",
+                        "border": "none",
+                        "borderRadius": "2px",
+                        "cursor": "pointer"
+                    }
+                }
+            })
+
         return {
             "type": "div",
             "props": {
@@ -497,13 +1006,14 @@ class StatusBar(Component):
         """Render the status bar component."""
         current_file = current_file_state.value
         file_type = get_file_type(current_file) if current_file else "none"
-        
+        save_error = save_error_state.value
+
         return {
             "type": "div",
             "props": {
                 "style": {
                     "height": "22px",
-                    "backgroundColor": "#007acc",
+                    "backgroundColor": "#a1260d" if save_error else "#007acc",
                     "color": "white",
                     "display": "flex",
                     "alignItems": "center",
@@ -529,7 +1039,17 @@ class StatusBar(Component):
                                             "marginRight": "15px"
                                         }
                                     }
-                                }
+                                },
+                                # Failed-save notice; the bar turns red with it
+                                *([{
+                                    "type": "span",
+                                    "props": {
+                                        "content": f"⚠ {save_error}",
+                                        "style": {
+                                            "fontWeight": "bold"
+                                        }
+                                    }
+                                }] if save_error else [])
                             ]
                         }
                     },
@@ -563,6 +1083,37 @@ file_explorer = FileExplorer()
 editor = Editor()
 status_bar = StatusBar()
 
+# Register event handler for lazy directory expansion
+@app.event("expand_dir")
+def handle_expand_dir(event_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Handle directory expansion event by scanning the directory on demand."""
+    if not event_data or "path" not in event_data:
+        if DEBUG:
+            print("DEBUG: No path in expand event data")
+        return {"error": "No path in event data"}
+
+    dir_path = event_data["path"]
+    if DEBUG:
+        print(f"DEBUG: Expanding directory: {dir_path}")
+
+    tree = workspace_state.value
+    node = find_node(tree, dir_path)
+    if node is None or node.get("type") != "directory":
+        if DEBUG:
+            print(f"DEBUG: Directory not found in tree: {dir_path}")
+        return {"error": "Directory not found"}
+
+    # Re-expanding an already-scanned directory is free: reuse the cached
+    # listing instead of touching the filesystem again.
+    if dir_path not in expanded_dirs:
+        expanded_dirs[dir_path] = scan_directory(dir_path)
+
+    node["children"] = expanded_dirs[dir_path]
+    bump_tree_generation()
+    workspace_state.set(tree)
+
+    return {"directory": dir_path, "children": len(expanded_dirs[dir_path])}
+
 # Register event handler for file selection
 @app.event("select_file")
 def handle_select_file(event_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -589,14 +1140,36 @@ def handle_select_file(event_data: Optional[Dict[str, Any]] = None) -> Dict[str,
     # Update current file state
     if DEBUG:
         print(f"DEBUG: Setting current_file_state to: {file_path}")
+    # Only the old and new current file items render differently, so a
+    # 2-entry eviction keeps the rest of the memoized tree intact.
+    file_explorer.invalidate_render_cache(current_file_state.value, file_path)
     current_file_state.set(file_path)
     
-    # Read file content
-    content = read_file_content(file_path)
-    if DEBUG:
-        print(f"DEBUG: Read content (first 50 chars): {content[:50]}")
-        print(f"DEBUG: Setting file_content_state (length): {len(content)}")
-    file_content_state.set(content)
+    # Cache hits complete synchronously; misses are read on a worker thread
+    # so the handler returns (and the header renders) before the disk does.
+    cached = peek_file_content(file_path)
+    if cached is not None:
+        if DEBUG:
+            print(f"DEBUG: Content cache hit for: {file_path}")
+        file_content_state.set(cached["content"])
+        file_truncated_state.set(cached["truncated"])
+        file_loading_state.set(False)
+    else:
+        file_content_state.set("Loading...")
+        file_truncated_state.set(False)
+        file_loading_state.set(True)
+
+        def load_in_background(path: str = file_path) -> None:
+            result = read_file_content_cached(path)
+            # Drop the result if the user has already moved on
+            if current_file_state.value == path:
+                if DEBUG:
+                    print(f"DEBUG: Background read done (length): {len(result['content'])}")
+                file_content_state.set(result["content"])
+                file_truncated_state.set(result["truncated"])
+                file_loading_state.set(False)
+
+        scan_executor.submit(load_in_background)
     
     if DEBUG:
         print(f"Selected file: {file_path}")
@@ -606,6 +1179,22 @@ def handle_select_file(event_data: Optional[Dict[str, Any]] = None) -> Dict[str,
         "type": get_file_type(file_path)
     }
 
+# Event handler for loading the rest of a truncated file
+@app.event("load_more_content")
+def handle_load_more_content(event_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Handle loading the remainder of a file that was read truncated."""
+    if not event_data or "path" not in event_data:
+        if DEBUG:
+            print("DEBUG: No path in load more event data")
+        return {"error": "No path in event data"}
+
+    file_path = event_data["path"]
+    result = read_file_content(file_path, max_bytes=None)
+    file_content_state.set(result["content"])
+    file_truncated_state.set(False)
+
+    return {"file": file_path, "size": result["size"]}
+
 # Event handler for updating file content
 @app.event("update_file_content")
 def handle_update_file_content(event_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -620,23 +1209,41 @@ def handle_update_file_content(event_data: Optional[Dict[str, Any]] = None) -> D
     
     file_path = event_data["path"]
     new_content = event_data["content"]
-    
+
     # Check if it's a directory
     if os.path.isdir(file_path):
         if DEBUG:
             print(f"DEBUG: Cannot update directory: {file_path}")
         return {"error": "Cannot update directory"}
+
+    # The textarea shows a "Loading..." placeholder while a background read
+    # is in flight; never write that placeholder over the real file
+    if file_loading_state.value:
+        if DEBUG:
+            print(f"DEBUG: Refusing to save while file is loading: {file_path}")
+        return {"error": "File is still loading; wait for it to open before saving"}
+
+    # Never write back a partially-loaded file: that would drop its tail
+    if file_truncated_state.value:
+        if DEBUG:
+            print(f"DEBUG: Refusing to save truncated file: {file_path}")
+        return {"error": "File is partially loaded; load the full file before saving"}
     
-    # Write the updated content to the file
+    # Schedule the debounced atomic write; bursts of keystrokes coalesce
+    # into a single temp-file + os.replace on disk.
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        schedule_file_write(file_path, new_content)
         if DEBUG:
-            print(f"DEBUG: Successfully updated file: {file_path}")
-        
+            print(f"DEBUG: Scheduled write for file: {file_path}")
+
         # Update the file content state
         file_content_state.set(new_content)
-        
+
+        # A previous debounced flush may have failed after its event already
+        # returned; report it here so the frontend stops assuming saved
+        if save_error_state.value is not None:
+            return {"error": save_error_state.value, "file": file_path}
+
         return {
             "success": True,
             "file": file_path
@@ -717,9 +1324,16 @@ if __name__ == "__main__":
                        help="Run mode: 'web' for browser or 'desktop' for desktop window")
     parser.add_argument("--width", type=int, default=1200, help="Window width (desktop mode only)")
     parser.add_argument("--height", type=int, default=800, help="Window height (desktop mode only)")
+    parser.add_argument("--no-ignore", action="store_true",
+                       help="Show directories that are skipped by default (.git, node_modules, ...)")
     
     args = parser.parse_args()
-    
+
+    # Rescan with the ignore set cleared if the user wants everything shown
+    if args.no_ignore:
+        IGNORE_DIRS.clear()
+        invalidate_and_rescan()
+
     # Launch application
     app.brew(
         type=args.mode,
@@ -4,10 +4,64 @@ This file demonstrates a more complex Python application structure.
 """
 
 import os
+import sys
 import json
 import logging
+import functools
 from typing import Dict, List, Optional, Any
 
+# Optional fast JSON parser; stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional lazy JSON parser: simdjson builds a structural index and only
+# materializes the keys actually read, so big configs parse in O(keys-read)
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Optional streaming parser: lets huge configs be read key-by-key without
+# ever materializing the whole document
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Cache-miss marker distinct from any real config value
+_SENTINEL = object()
+
+@functools.lru_cache(maxsize=64)
+def _make_getter(keys: tuple):
+    """Compile a key tuple into a specialized straight-line lookup closure.
+
+    The generated function indexes the whole path in one expression — no
+    Python-level loop — and is cached per key tuple, so frequently used
+    paths like ("settings", "theme") pay the codegen cost once.
+    """
+    chain = "".join(f"[{key!r}]" for key in keys)
+    source = (
+        "def _getter(obj, default):\n"
+        "    try:\n"
+        f"        return obj{chain}\n"
+        "    except (KeyError, TypeError, IndexError):\n"
+        "        return default\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace["_getter"]
+
+def _to_native(value: Any) -> Any:
+    """Convert a simdjson lazy proxy into a plain Python value."""
+    if simdjson is not None:
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+    return value
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -18,36 +72,107 @@ logger = logging.getLogger(__name__)
 class ConfigManager:
     """Manages application configuration."""
     
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, needed_keys: Optional[tuple] = None):
         self.config_path = config_path
+        # With needed_keys and ijson available, only those top-level keys
+        # are parsed out of the file; everything else reads as absent
+        self._needed_keys = needed_keys
         self.config: Dict[str, Any] = {}
+        # Parser is per instance: reusing a simdjson parser invalidates the
+        # documents it produced, so a shared one would break every other
+        # live ConfigManager's lazy _doc on each load
+        self._parser = simdjson.Parser() if simdjson is not None else None
+        self._doc = None  # Lazy simdjson document when that parser is in use
+        # Memoized get_nested results keyed by the key tuple, fronted by a
+        # single-slot cache for the repeated-same-lookup case
+        self._nested_cache: Dict[tuple, Any] = {}
+        self._last_key: Optional[tuple] = None
+        self._last_val: Any = None
         self.load_config()
-    
+
     def load_config(self) -> None:
         """Load configuration from JSON file."""
+        self._doc = None
+        self._nested_cache.clear()
+        self._last_key = None
+        self._last_val = None
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
-            logger.info(f"Configuration loaded from {self.config_path}")
+            if self._needed_keys and ijson is not None:
+                self.config = self._load_streaming()
+            elif self._parser is not None:
+                # Parse lazily: keys are materialized on access in get()
+                with open(self.config_path, 'rb') as f:
+                    self._doc = self._parser.parse(f.read())
+            elif orjson is not None:
+                # orjson parses UTF-8 bytes directly, so read in binary mode
+                with open(self.config_path, 'rb') as f:
+                    self.config = orjson.loads(f.read())
+            else:
+                with open(self.config_path, 'r') as f:
+                    self.config = json.load(f)
+            logger.info("Configuration loaded from %s", self.config_path)
         except FileNotFoundError:
-            logger.error(f"Configuration file not found: {self.config_path}")
+            logger.error("Configuration file not found: %s", self.config_path)
             self.config = {"error": "Configuration not found"}
-        except json.JSONDecodeError:
-            logger.error(f"Invalid JSON in configuration file: {self.config_path}")
+        except ValueError:
+            # Covers json.JSONDecodeError, orjson.JSONDecodeError and the
+            # translated ijson errors from _load_streaming
+            logger.error("Invalid JSON in configuration file: %s", self.config_path)
             self.config = {"error": "Invalid configuration format"}
-    
+
+    def _load_streaming(self) -> Dict[str, Any]:
+        """Stream only the needed top-level keys out of the config file.
+
+        ijson walks the file incrementally, so peak memory is bounded by the
+        values kept rather than the file size, and the read stops as soon as
+        the last needed key has been seen.
+        """
+        config: Dict[str, Any] = {}
+        remaining = set(self._needed_keys)
+        try:
+            with open(self.config_path, 'rb') as f:
+                for key, value in ijson.kvitems(f, ''):
+                    if key in remaining:
+                        config[key] = value
+                        remaining.discard(key)
+                        if not remaining:
+                            break
+        except ijson.JSONError as exc:
+            # Normalize onto ValueError so load_config's handler covers it
+            raise ValueError(str(exc)) from exc
+        return config
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by key."""
+        if self._doc is not None:
+            try:
+                return _to_native(self._doc[key])
+            except KeyError:
+                return default
         return self.config.get(key, default)
-    
+
     def get_nested(self, *keys: str, default: Any = None) -> Any:
         """Get a nested configuration value."""
-        current = self.config
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return default
+        # Single-slot fast path for the common repeated lookup, then the
+        # memo dict; only successful walks are cached so the caller-supplied
+        # default never leaks into a later call.
+        if keys == self._last_key:
+            return self._last_val
+        hit = self._nested_cache.get(keys, _SENTINEL)
+        if hit is not _SENTINEL:
+            self._last_key = keys
+            self._last_val = hit
+            return hit
+
+        root = self._doc if self._doc is not None else self.config
+        current = _make_getter(keys)(root, _SENTINEL)
+        if current is _SENTINEL:
+            return default
+        current = _to_native(current)
+
+        self._nested_cache[keys] = current
+        self._last_key = keys
+        self._last_val = current
         return current
 
 class Application:
@@ -57,28 +182,34 @@ class Application:
         self.config_manager = ConfigManager(config_path)
         self.name = self.config_manager.get("appName", "Default App")
         self.version = self.config_manager.get("version", "0.0.0")
-        logger.info(f"Initializing application: {self.name} v{self.version}")
+        logger.info("Initializing application: %s v%s", self.name, self.version)
     
     def run(self) -> None:
         """Run the application."""
-        logger.info(f"Running {self.name}")
+        logger.info("Running %s", self.name)
         theme = self.config_manager.get_nested("settings", "theme", default="light")
         font_size = self.config_manager.get_nested("settings", "fontSize", default=12)
         
-        logger.info(f"Using theme: {theme}, font size: {font_size}")
-        
-        # Simulate application execution
-        print(f"Welcome to {self.name} v{self.version}!")
-        print(f"Theme: {theme}")
-        print(f"Font Size: {font_size}")
-        
+        logger.info("Using theme: %s, font size: %s", theme, font_size)
+
+        # Simulate application execution; collect every line and emit them
+        # with a single stdout write instead of one syscall per print
+        parts = [
+            f"Welcome to {self.name} v{self.version}!",
+            f"Theme: {theme}",
+            f"Font Size: {font_size}"
+        ]
+
         # List features
         features = self.config_manager.get("features", {})
         if features:
-            print("\nEnabled Features:")
-            for feature, enabled in features.items():
-                status = "Enabled" if enabled else "Disabled"
-                print(f"- {feature}: {status}")
+            parts.append("\nEnabled Features:")
+            parts.extend(
+                f"- {feature}: {'Enabled' if enabled else 'Disabled'}"
+                for feature, enabled in features.items()
+            )
+
+        sys.stdout.write("\n".join(parts) + "\n")
 
 if __name__ == "__main__":
     app = Application()
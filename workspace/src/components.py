@@ -7,107 +7,175 @@ from typing import Dict, List, Any, Optional, Callable
 
 class Component:
     """Base component class."""
-    
+
+    # Rendered node type; the per-class template constant shared by every
+    # instance instead of a fresh string per render
+    _TYPE: Optional[str] = None
+
+    __slots__ = ('_dirty', '_render_cache', 'id', 'children', 'parent',
+                 '_evt_name', '_evt_handler', '_evt_extra')
+
     def __init__(self, id: str = None):
+        self._dirty = True
+        self._render_cache: Optional[Dict[str, Any]] = None
         self.id = id
-        self.children: List[Component] = []
+        # Keyed by id(child) for O(1) removal; insertion-ordered like a list
+        self.children: Dict[int, 'Component'] = {}
         self.parent: Optional[Component] = None
-        self.event_handlers: Dict[str, Callable] = {}
-    
+        # Most components register zero or one handler, so the first one
+        # lives in a pair of fields; a dict is only allocated for the rest
+        self._evt_name: Optional[str] = None
+        self._evt_handler: Optional[Callable] = None
+        self._evt_extra: Optional[Dict[str, Callable]] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating cached renders for visible fields."""
+        object.__setattr__(self, name, value)
+        # Underscore and bookkeeping fields don't affect rendered output
+        if not name.startswith("_") and name != "parent":
+            self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """Invalidate this component's cached render and its ancestors'."""
+        node = self
+        while node is not None and not node._dirty:
+            node._dirty = True
+            node = node.parent
+
     def add_child(self, child: 'Component') -> 'Component':
         """Add a child component."""
-        self.children.append(child)
+        self.children[id(child)] = child
         child.parent = self
+        self.mark_dirty()
         return self
-    
+
     def remove_child(self, child: 'Component') -> bool:
         """Remove a child component."""
-        if child in self.children:
-            self.children.remove(child)
+        if self.children.pop(id(child), None) is not None:
             child.parent = None
+            self.mark_dirty()
             return True
         return False
     
     def on(self, event: str, handler: Callable) -> 'Component':
         """Register an event handler."""
-        self.event_handlers[event] = handler
+        if self._evt_name is None or self._evt_name == event:
+            self._evt_name = event
+            self._evt_handler = handler
+        else:
+            if self._evt_extra is None:
+                self._evt_extra = {}
+            self._evt_extra[event] = handler
         return self
-    
+
     def trigger(self, event: str, data: Any = None) -> Any:
         """Trigger an event."""
-        if event in self.event_handlers:
-            return self.event_handlers[event](data)
+        # Single-slot fast path: a string compare and a direct call
+        if event == self._evt_name:
+            return self._evt_handler(data)
+        if self._evt_extra is not None:
+            handler = self._evt_extra.get(event)
+            if handler is not None:
+                return handler(data)
         return None
     
+    def build_props(self) -> Dict[str, Any]:
+        """Build the props dict for this component (overridden by subclasses)."""
+        return {"id": self.id}
+
     def render(self) -> Dict[str, Any]:
-        """Render the component (to be implemented by subclasses)."""
-        raise NotImplementedError("Subclasses must implement render()")
+        """Render the component from its type template and props."""
+        return self.render_tree()
+
+    def render_tree(self) -> Dict[str, Any]:
+        """Render this subtree in one explicit-stack walk.
+
+        Each node emits its dict with an empty children list and pushes its
+        children paired with that list, so they append themselves in place —
+        no recursive call frames, however deep the tree. Clean subtrees are
+        spliced in from their cached render without being walked.
+        """
+        if not self._dirty and self._render_cache is not None:
+            return self._render_cache
+        root_slot: List[Dict[str, Any]] = []
+        stack = [(self, root_slot)]
+        while stack:
+            node, out = stack.pop()
+            if node._TYPE is None:
+                raise NotImplementedError("Subclasses must define _TYPE")
+            if not node._dirty and node._render_cache is not None:
+                out.append(node._render_cache)
+                continue
+            props = node.build_props()
+            children: List[Dict[str, Any]] = []
+            props["children"] = children
+            rendered = {"type": node._TYPE, "props": props}
+            node._render_cache = rendered
+            node._dirty = False
+            out.append(rendered)
+            # LIFO stack, so push in reverse to keep declaration order
+            stack.extend((child, children)
+                         for child in reversed(list(node.children.values())))
+        return root_slot[0]
 
 
 class Button(Component):
     """Button component."""
-    
+
+    _TYPE = "button"
+
+    __slots__ = ('label', 'style')
+
     def __init__(self, label: str, id: str = None, style: Dict[str, Any] = None):
         super().__init__(id)
         self.label = label
         self.style = style or {}
-    
-    def render(self) -> Dict[str, Any]:
-        """Render the button component."""
-        return {
-            "type": "button",
-            "props": {
-                "id": self.id,
-                "label": self.label,
-                "style": self.style,
-                "children": [child.render() for child in self.children]
-            }
-        }
+
+    def build_props(self) -> Dict[str, Any]:
+        """Build the button props."""
+        return {"id": self.id, "label": self.label, "style": self.style}
 
 
 class Container(Component):
     """Container component."""
-    
+
+    _TYPE = "div"
+
+    __slots__ = ('style',)
+
     def __init__(self, id: str = None, style: Dict[str, Any] = None):
         super().__init__(id)
         self.style = style or {}
-    
-    def render(self) -> Dict[str, Any]:
-        """Render the container component."""
-        return {
-            "type": "div",
-            "props": {
-                "id": self.id,
-                "style": self.style,
-                "children": [child.render() for child in self.children]
-            }
-        }
+
+    def build_props(self) -> Dict[str, Any]:
+        """Build the container props."""
+        return {"id": self.id, "style": self.style}
 
 
 class Text(Component):
     """Text component."""
-    
+
+    _TYPE = "text"
+
+    __slots__ = ('content', 'style')
+
     def __init__(self, content: str, id: str = None, style: Dict[str, Any] = None):
         super().__init__(id)
         self.content = content
         self.style = style or {}
-    
-    def render(self) -> Dict[str, Any]:
-        """Render the text component."""
-        return {
-            "type": "text",
-            "props": {
-                "id": self.id,
-                "content": self.content,
-                "style": self.style,
-                "children": [child.render() for child in self.children]
-            }
-        }
+
+    def build_props(self) -> Dict[str, Any]:
+        """Build the text props."""
+        return {"id": self.id, "content": self.content, "style": self.style}
 
 
 class Input(Component):
     """Input component."""
-    
+
+    _TYPE = "input"
+
+    __slots__ = ('placeholder', 'value', 'input_type', 'style')
+
     def __init__(self, 
                  id: str = None, 
                  placeholder: str = "", 
@@ -120,60 +188,65 @@ class Input(Component):
         self.input_type = input_type
         self.style = style or {}
     
-    def render(self) -> Dict[str, Any]:
-        """Render the input component."""
+    def build_props(self) -> Dict[str, Any]:
+        """Build the input props."""
         return {
-            "type": "input",
-            "props": {
-                "id": self.id,
-                "placeholder": self.placeholder,
-                "value": self.value,
-                "type": self.input_type,
-                "style": self.style,
-                "children": [child.render() for child in self.children]
-            }
+            "id": self.id,
+            "placeholder": self.placeholder,
+            "value": self.value,
+            "type": self.input_type,
+            "style": self.style
         }
 
 
 # Example usage
+
+# Sample UI styles, allocated once at import; repeated create_sample_ui
+# calls share these instead of rebuilding the same literals each time
+_CONTAINER_STYLE = {"padding": "20px"}
+_TITLE_STYLE = {"fontSize": "24px", "fontWeight": "bold", "marginBottom": "20px"}
+_FORM_STYLE = {"display": "flex", "flexDirection": "column", "gap": "10px"}
+_INPUT_STYLE = {"padding": "8px", "borderRadius": "4px", "border": "1px solid #ccc"}
+_BUTTON_STYLE = {
+    "padding": "8px 16px",
+    "backgroundColor": "#4CAF50",
+    "color": "white",
+    "border": "none",
+    "borderRadius": "4px",
+    "cursor": "pointer",
+    "marginTop": "10px"
+}
+
 def create_sample_ui() -> Dict[str, Any]:
     """Create a sample UI structure."""
-    container = Container(id="main-container", style={"padding": "20px"})
+    container = Container(id="main-container", style=_CONTAINER_STYLE)
     
     # Add a title
     title = Text(
         content="Sample UI Components", 
-        style={"fontSize": "24px", "fontWeight": "bold", "marginBottom": "20px"}
+        style=_TITLE_STYLE
     )
     container.add_child(title)
     
     # Add a form
-    form = Container(style={"display": "flex", "flexDirection": "column", "gap": "10px"})
+    form = Container(style=_FORM_STYLE)
     
     username_input = Input(
         id="username",
         placeholder="Enter username",
-        style={"padding": "8px", "borderRadius": "4px", "border": "1px solid #ccc"}
+        style=_INPUT_STYLE
     )
     
     password_input = Input(
         id="password",
         placeholder="Enter password",
         input_type="password",
-        style={"padding": "8px", "borderRadius": "4px", "border": "1px solid #ccc"}
+        style=_INPUT_STYLE
     )
     
     submit_button = Button(
         label="Login",
-        style={
-            "padding": "8px 16px",
-            "backgroundColor": "#4CAF50",
-            "color": "white",
-            "border": "none",
-            "borderRadius": "4px",
-            "cursor": "pointer",
-            "marginTop": "10px"
-        }
+        style=_BUTTON_STYLE
     )
     
     # Register event handler
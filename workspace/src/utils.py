@@ -5,18 +5,31 @@ Utility functions for the sample project.
 import os
 import sys
 import time
-import random
+import types
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple, Union
 
+_ID_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789"
+# 256-entry table folding every byte value onto the alphabet, so the whole
+# mapping happens in one C-level bytes.translate call
+_ID_TRANSLATE = bytes(ord(_ID_ALPHABET[b % len(_ID_ALPHABET)]) for b in range(256))
+
 def generate_id(prefix: str = "", length: int = 8) -> str:
     """Generate a random ID with optional prefix."""
-    chars = "abcdefghijklmnopqrstuvwxyz0123456789"
-    random_part = ''.join(random.choice(chars) for _ in range(length))
+    random_part = os.urandom(length).translate(_ID_TRANSLATE).decode('ascii')
     return f"{prefix}{random_part}"
 
+@lru_cache(maxsize=4096)
+def _format_time_int(ts_int: int) -> str:
+    """Format an integer-second timestamp, memoized per distinct second."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts_int))
+
 def format_time(timestamp: float) -> str:
     """Format a timestamp into a human-readable string."""
-    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+    # The format has one-second resolution, so truncating to int makes
+    # repeated timestamps (ctime/mtime/atime, sibling files from the same
+    # build) hit the cache instead of calling localtime/strftime again
+    return _format_time_int(int(timestamp))
 
 def get_file_info(file_path: str) -> Dict[str, Any]:
     """Get information about a file."""
@@ -34,33 +47,62 @@ def get_file_info(file_path: str) -> Dict[str, Any]:
         "extension": os.path.splitext(file_path)[1] if not os.path.isdir(file_path) else None
     }
 
+def _file_info_from_entry(entry: os.DirEntry) -> Dict[str, Any]:
+    """Build a file-info dict from a DirEntry using its cached stat data."""
+    try:
+        stats = entry.stat()
+        is_directory = entry.is_dir()
+    except OSError:
+        return {"error": "File not found"}
+    return {
+        "path": entry.path,
+        "size": stats.st_size,
+        "created": format_time(stats.st_ctime),
+        "modified": format_time(stats.st_mtime),
+        "accessed": format_time(stats.st_atime),
+        "is_directory": is_directory,
+        "extension": os.path.splitext(entry.name)[1] if not is_directory else None
+    }
+
 def list_directory(directory: str, recursive: bool = False) -> List[Dict[str, Any]]:
     """List files in a directory, optionally recursively."""
-    if not os.path.exists(directory) or not os.path.isdir(directory):
+    if not os.path.isdir(directory):
         return [{"error": "Directory not found or not a directory"}]
-    
+
+    # scandir returns DirEntry objects whose stat/is_dir results come from
+    # the directory read itself, so each entry costs at most one stat call.
     result = []
-    
-    if recursive:
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                result.append(get_file_info(file_path))
-            for dir_name in dirs:
-                dir_path = os.path.join(root, dir_name)
-                result.append(get_file_info(dir_path))
-    else:
-        for item in os.listdir(directory):
-            item_path = os.path.join(directory, item)
-            result.append(get_file_info(item_path))
-    
+    stack = [directory]
+
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    result.append(_file_info_from_entry(entry))
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            result.append({"error": f"Cannot read directory: {current}"})
+
     return result
 
+def safe_read_bytes(file_path: str, default: bytes = b"") -> bytes:
+    """Safely read a file's raw bytes with error handling."""
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    except Exception as e:
+        print(f"Error reading file {file_path}: {str(e)}")
+        return default
+
 def safe_read_file(file_path: str, default: str = "") -> str:
     """Safely read a file with error handling."""
+    # Read the raw bytes in one go and decode once: skips the TextIOWrapper
+    # layer's incremental decoding, which is noticeably slower on large files.
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        with open(file_path, 'rb') as f:
+            return f.read().decode('utf-8')
     except Exception as e:
         print(f"Error reading file {file_path}: {str(e)}")
         return default
@@ -79,26 +121,26 @@ def safe_write_file(file_path: str, content: str) -> bool:
         print(f"Error writing to file {file_path}: {str(e)}")
         return False
 
+# Extension-to-type table, built once at import with interned keys and
+# frozen against accidental mutation
+_TYPE_MAP = types.MappingProxyType({sys.intern(ext): file_type for ext, file_type in {
+    ".py": "python",
+    ".js": "javascript",
+    ".html": "html",
+    ".css": "css",
+    ".json": "json",
+    ".md": "markdown",
+    ".txt": "text",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".png": "image",
+    ".gif": "image",
+    ".svg": "image"
+}.items()})
+_TYPE_MAP_GET = _TYPE_MAP.get
+
 def get_file_type(file_path: str) -> str:
     """Determine file type based on extension."""
     if os.path.isdir(file_path):
         return "directory"
-        
-    extension = os.path.splitext(file_path)[1].lower()
-    
-    type_map = {
-        ".py": "python",
-        ".js": "javascript",
-        ".html": "html",
-        ".css": "css",
-        ".json": "json",
-        ".md": "markdown",
-        ".txt": "text",
-        ".jpg": "image",
-        ".jpeg": "image",
-        ".png": "image",
-        ".gif": "image",
-        ".svg": "image"
-    }
-    
-    return type_map.get(extension, "unknown")
\ No newline at end of file
+    return _TYPE_MAP_GET(os.path.splitext(file_path)[1].lower(), "unknown")
\ No newline at end of file